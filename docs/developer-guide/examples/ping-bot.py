@@ -2,7 +2,8 @@
 """Example bot that responds to /ping with Pong! and latency.
 
 Prerequisites:
-    pip install requests websocket-client
+    pip install aiohttp "websockets>=14"
+    pip install orjson pysimdjson uvloop  # optional, faster JSON and event loop
 
 Usage:
     1. Set SERVER_URL, USER_JWT below (or via environment variables).
@@ -10,13 +11,46 @@ Usage:
     3. Install the bot in a guild, then type /ping in any channel.
 """
 
+import asyncio
 import json
 import os
+import ssl
 import sys
 import time
 
-import requests
-import websocket
+import aiohttp
+import websockets
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    dumps = json.dumps
+    loads = json.loads
+
+try:
+    import simdjson
+
+    # One reusable parser. Events come back as lazy proxies, so only the
+    # fields we actually read are turned into Python objects. A proxy is
+    # invalidated by the next parse, so never keep one across events.
+    _parser = simdjson.Parser()
+
+    def parse_event(raw):
+        return _parser.parse(raw if isinstance(raw, bytes) else raw.encode())
+except ImportError:
+    parse_event = loads
+
+try:
+    import uvloop
+
+    run = uvloop.run
+except ImportError:
+    run = asyncio.run
 
 SERVER_URL = os.environ.get("CANIS_SERVER_URL", "https://localhost:3000")
 USER_JWT = os.environ.get("CANIS_USER_JWT", "")
@@ -25,95 +59,190 @@ if not USER_JWT:
     print("Set CANIS_USER_JWT to your developer JWT token.")
     sys.exit(1)
 
+OUTBOX_SIZE = 256
+
 headers = {"Authorization": f"Bearer {USER_JWT}", "Content-Type": "application/json"}
 
 
-def api(method, path, json_data=None):
+async def api(session, method, path, json_data=None):
     url = f"{SERVER_URL}{path}"
-    resp = getattr(requests, method)(url, headers=headers, json=json_data, verify=False)
-    resp.raise_for_status()
-    return resp.json() if resp.content else None
-
-
-# 1. Create application
-print("Creating application...")
-app = api("post", "/api/applications", {"name": "PingBot", "description": "Responds to /ping"})
-app_id = app["id"]
-print(f"  Application ID: {app_id}")
-
-# 2. Create bot user (token shown ONCE)
-print("Creating bot user...")
-bot = api("post", f"/api/applications/{app_id}/bot")
-bot_token = bot["token"]
-bot_user_id = bot["bot_user_id"]
-print(f"  Bot user ID: {bot_user_id}")
-print(f"  Token: {bot_token} (save this!)")
-
-# 3. Register /ping command
-print("Registering /ping command...")
-api("put", f"/api/applications/{app_id}/commands", {
-    "commands": [{"name": "ping", "description": "Check bot latency", "options": []}]
-})
-print("  Registered.")
-
-# 4. Connect to bot gateway
-ws_url = SERVER_URL.replace("https", "wss").replace("http", "ws")
-print(f"Connecting to gateway: {ws_url}/api/gateway/bot")
-
-ws = websocket.create_connection(
-    f"{ws_url}/api/gateway/bot",
-    header={"Authorization": f"Bot {bot_token}"},
-    sslopt={"cert_reqs": 0},
-)
-print("Connected! Waiting for events...\n")
-
-# 5. Event loop
-try:
-    while True:
-        raw = ws.recv()
-        event = json.loads(raw)
-        event_type = event.get("type", "unknown")
-
-        if event_type == "command_invoked":
-            cmd = event["command_name"]
-            iid = event["interaction_id"]
-            user = event["user_id"]
-            print(f"[command] /{cmd} from {user} (interaction: {iid})")
-
-            if cmd == "ping":
-                start = time.monotonic()
-                ws.send(json.dumps({
-                    "type": "command_response",
-                    "interaction_id": iid,
-                    "content": f"Pong! (bot latency: {int((time.monotonic() - start) * 1000)}ms)",
-                    "ephemeral": False,
-                }))
-                print(f"  Responded with Pong!")
+    async with session.request(method, url, json=json_data) as resp:
+        resp.raise_for_status()
+        body = await resp.read()
+        return loads(body) if body else None
 
-        elif event_type == "message_created":
-            print(f"[message] {event['user_id']}: {event['content'][:80]}")
 
-        elif event_type == "guild_joined":
-            print(f"[guild] Joined: {event['guild_name']}")
+def insecure_ssl_context():
+    # Local dev servers use self-signed certificates.
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
 
-        elif event_type == "guild_left":
-            print(f"[guild] Left: {event['guild_id']}")
 
-        elif event_type == "error":
-            print(f"[error] {event['code']}: {event['message']}")
+async def send_responses(ws, outbox):
+    # Sends responses off the receive path. Whatever queued up while the last
+    # send was in flight goes out in one burst, though each response is still
+    # its own frame and write.
+    while True:
+        batch = [await outbox.get()]
+        while not outbox.empty():
+            batch.append(outbox.get_nowait())
+        try:
+            await asyncio.gather(*(ws.send(payload) for payload in batch))
+        finally:
+            for _ in batch:
+                outbox.task_done()
+
+
+async def drain_outbox(sender, outbox, timeout=5):
+    # Give already queued responses a chance to go out before the connection
+    # closes, unless the sender has died and nothing will drain the queue.
+    if sender.done():
+        return
+    drained = asyncio.create_task(outbox.join())
+    await asyncio.wait({drained, sender}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    drained.cancel()
+
+
+async def run_gateway(bot_token):
+    ws_url = SERVER_URL.replace("https", "wss").replace("http", "ws")
+    print(f"Connecting to gateway: {ws_url}/api/gateway/bot")
+
+    async with websockets.connect(
+        f"{ws_url}/api/gateway/bot",
+        additional_headers={"Authorization": f"Bot {bot_token}"},
+        ssl=insecure_ssl_context() if ws_url.startswith("wss") else None,
+        # Buffer up to 64 parsed frames (default 16) so bursts of events keep
+        # being read while handlers run.
+        max_queue=64,
+    ) as ws:
+        print("Connected! Waiting for events...\n")
+
+        # Bounded, so a stalled connection pushes back on the handlers instead
+        # of letting responses pile up in memory.
+        outbox = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        sender = asyncio.create_task(send_responses(ws, outbox))
+        receiver = asyncio.create_task(receive_events(ws, outbox))
+        try:
+            # Whichever side stops first ends the session, so a failed send
+            # cannot go unnoticed while events keep coming in.
+            await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            receiver.cancel()
+            await drain_outbox(sender, outbox)
+            sender.cancel()
+            for result in await asyncio.gather(receiver, sender, return_exceptions=True):
+                if isinstance(result, Exception):
+                    raise result
+
+
+async def on_command_invoked(event, outbox):
+    cmd = event["command_name"]
+    iid = event["interaction_id"]
+    user = event["user_id"]
+    print(f"[command] /{cmd} from {user} (interaction: {iid})")
+
+    if cmd == "ping":
+        start = time.monotonic()
+        await outbox.put(dumps({
+            "type": "command_response",
+            "interaction_id": iid,
+            "content": f"Pong! (bot latency: {int((time.monotonic() - start) * 1000)}ms)",
+            "ephemeral": False,
+        }))
+        print(f"  Responded with Pong!")
+
+
+async def on_message_created(event, outbox):
+    print(f"[message] {event['user_id']}: {event['content'][:80]}")
+
+
+async def on_guild_joined(event, outbox):
+    print(f"[guild] Joined: {event['guild_name']}")
+
+
+async def on_guild_left(event, outbox):
+    print(f"[guild] Left: {event['guild_id']}")
+
+
+async def on_error(event, outbox):
+    print(f"[error] {event['code']}: {event['message']}")
+
+
+# Handlers receive a simdjson proxy when pysimdjson is installed. They must
+# copy out the fields they need and never store `event` or schedule a task
+# that holds it, because it is invalidated by the next frame.
+EVENT_HANDLERS = {
+    "command_invoked": on_command_invoked,
+    "message_created": on_message_created,
+    "guild_joined": on_guild_joined,
+    "guild_left": on_guild_left,
+    "error": on_error,
+}
+
+
+async def receive_events(ws, outbox):
+    async for raw in ws:
+        event = parse_event(raw)
+        event_type = event.get("type", "unknown")
 
+        handler = EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            # The raw frame is already a string; no need to re-serialise.
+            print(f"[{event_type}] {raw[:120]}")
         else:
-            print(f"[{event_type}] {json.dumps(event)[:120]}")
-
-except KeyboardInterrupt:
-    print("\nShutting down...")
-finally:
-    ws.close()
-
-# Cleanup: delete application (cascades to bot user and commands)
-print("Cleaning up...")
-try:
-    api("delete", f"/api/applications/{app_id}")
-    print("  Application deleted.")
-except Exception:
-    print(f"  Cleanup failed. Delete manually: DELETE /api/applications/{app_id}")
+            await handler(event, outbox)
+
+        # Drop the proxy before the next parse; simdjson refuses to reuse the
+        # parser while an Object from the previous document is still alive.
+        del event
+
+
+async def main():
+    connector = aiohttp.TCPConnector(ssl=False)
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        # 1. Create application
+        print("Creating application...")
+        app = await api(session, "post", "/api/applications", {"name": "PingBot", "description": "Responds to /ping"})
+        app_id = app["id"]
+        print(f"  Application ID: {app_id}")
+
+        # 2. Create bot user (token shown ONCE)
+        print("Creating bot user...")
+        bot = await api(session, "post", f"/api/applications/{app_id}/bot")
+        bot_token = bot["token"]
+        bot_user_id = bot["bot_user_id"]
+        print(f"  Bot user ID: {bot_user_id}")
+        print(f"  Token: {bot_token} (save this!)")
+
+        # 3. Register /ping command
+        print("Registering /ping command...")
+        await api(session, "put", f"/api/applications/{app_id}/commands", {
+            "commands": [{"name": "ping", "description": "Check bot latency", "options": []}]
+        })
+        print("  Registered.")
+
+        # 4. Connect to bot gateway and run the event loop
+        try:
+            await run_gateway(bot_token)
+        except asyncio.CancelledError:
+            # Ctrl+C cancels the main task; fall through to cleanup.
+            print("\nShutting down...")
+        except websockets.ConnectionClosed as exc:
+            print(f"\nGateway connection closed: {exc}")
+
+        # Cleanup: delete application (cascades to bot user and commands)
+        print("Cleaning up...")
+        try:
+            await api(session, "delete", f"/api/applications/{app_id}")
+            print("  Application deleted.")
+        except Exception:
+            print(f"  Cleanup failed. Delete manually: DELETE /api/applications/{app_id}")
+
+
+if __name__ == "__main__":
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        pass
@@ -3,15 +3,21 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[1]
 ROADMAP_PATH = ROOT / "docs/project/roadmap.md"
 CHANGELOG_PATH = ROOT / "CHANGELOG.md"
-PLAN_LIFECYCLE_PATH = ROOT / "docs/plans/PLAN_LIFECYCLE.md"
+PLANS_DIR = ROOT / "docs/plans"
+PLAN_LIFECYCLE_PATH = PLANS_DIR / "PLAN_LIFECYCLE.md"
 RELEASE_TEMPLATE_PATH = ROOT / "docs/project/RELEASE_NOTES_TEMPLATE.md"
 
 LIFECYCLE_STATUSES = {"Active", "Superseded", "Archived"}
@@ -26,6 +32,29 @@ REQUIRED_TEMPLATE_HEADINGS = [
     "### Security",
 ]
 
+# The roadmap and changelog are scanned as memory-mapped bytes, so these
+# patterns are bytes patterns; only the captured groups are decoded. Unlike
+# read_text there is no newline translation, so they accept CRLF endings too.
+UNRELEASED_RE = re.compile(
+    rb"^## \[Unreleased\]\r?\n(?P<body>.*?)(?=^## \[|\Z)", re.MULTILINE | re.DOTALL
+)
+PHASE_RE = re.compile(rb"^\*\*Current Phase:\*\*\s*(.+)$", re.MULTILINE)
+DATE_RE = re.compile(
+    rb"^\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})\r?$", re.MULTILINE
+)
+ROADMAP_LINK_RE = re.compile(rb"\((\.\./plans/[^)]+\.md)\)")
+ROADMAP_ALIGNMENT_RE = re.compile(
+    r"^### Roadmap Alignment\n(?P<body>.*?)(?=^### |\Z)", re.MULTILINE | re.DOTALL
+)
+ALIGNMENT_PHASE_RE = re.compile(r"^- Current roadmap phase:\s*(.+)$", re.MULTILINE)
+ALIGNMENT_UPDATED_RE = re.compile(
+    r"^- Roadmap last updated:\s*(\d{4}-\d{2}-\d{2})$", re.MULTILINE
+)
+TABLE_LINE_RE = re.compile(r"^[ \t]*(\|.*)$", re.MULTILINE)
+TEMPLATE_HEADINGS_RE = re.compile(
+    "|".join(re.escape(heading) for heading in REQUIRED_TEMPLATE_HEADINGS)
+)
+
 
 def read_text(path: Path, errors: list[str]) -> str:
     if not path.exists():
@@ -34,27 +63,59 @@ def read_text(path: Path, errors: list[str]) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def extract_unreleased(changelog: str, errors: list[str]) -> str:
-    match = re.search(
-        r"^## \[Unreleased\]\n(?P<body>.*?)(?=^## \[|\Z)",
-        changelog,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+@contextmanager
+def map_file(path: Path, errors: list[str]) -> Iterator[bytes | mmap.mmap]:
+    """Map a file read-only so it can be scanned without copying it into a str."""
+    if not path.exists():
+        errors.append(f"Missing required file: {path.relative_to(ROOT)}")
+        yield b""
+        return
+    with path.open("rb") as f:
+        # Empty files cannot be mapped.
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def decode_text(data: bytes) -> str:
+    """Decode a captured group with the newline translation read_text applies."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+@lru_cache(maxsize=None)
+def read_plan(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def list_plan_files() -> set[str]:
+    """Return the names of all files directly under docs/plans."""
+    if not PLANS_DIR.is_dir():
+        return set()
+    with os.scandir(PLANS_DIR) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def plan_exists(plan_rel: str, plan_files: set[str]) -> bool:
+    if "/" in plan_rel:
+        return (PLANS_DIR / plan_rel).exists()
+    return plan_rel in plan_files
+
+
+def extract_unreleased(changelog: bytes | mmap.mmap, errors: list[str]) -> str:
+    match = UNRELEASED_RE.search(changelog)
     if not match:
         errors.append("CHANGELOG.md is missing a [Unreleased] section")
         return ""
-    return match.group("body")
+    return decode_text(match.group("body"))
 
 
-def parse_roadmap_metadata(roadmap: str, errors: list[str]) -> tuple[str, str]:
-    phase_match = re.search(
-        r"^\*\*Current Phase:\*\*\s*(.+)$", roadmap, flags=re.MULTILINE
-    )
-    date_match = re.search(
-        r"^\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})$",
-        roadmap,
-        flags=re.MULTILINE,
-    )
+def parse_roadmap_metadata(
+    roadmap: bytes | mmap.mmap, errors: list[str]
+) -> tuple[str, str]:
+    phase_match = PHASE_RE.search(roadmap)
+    date_match = DATE_RE.search(roadmap)
 
     if not phase_match:
         errors.append("Roadmap is missing '**Current Phase:**' metadata")
@@ -62,13 +123,16 @@ def parse_roadmap_metadata(roadmap: str, errors: list[str]) -> tuple[str, str]:
         errors.append("Roadmap is missing '**Last Updated:**' metadata")
 
     return (
-        phase_match.group(1).strip() if phase_match else "",
-        date_match.group(1).strip() if date_match else "",
+        decode_text(phase_match.group(1)).strip() if phase_match else "",
+        decode_text(date_match.group(1)).strip() if date_match else "",
     )
 
 
-def validate_roadmap_links(roadmap: str, errors: list[str]) -> None:
-    rel_links = sorted(set(re.findall(r"\((\.\./plans/[^)]+\.md)\)", roadmap)))
+def validate_roadmap_links(roadmap: bytes | mmap.mmap, errors: list[str]) -> None:
+    # dict keeps first-seen order, so errors follow the roadmap's own order.
+    rel_links = dict.fromkeys(
+        match.group(1).decode("utf-8") for match in ROADMAP_LINK_RE.finditer(roadmap)
+    )
     for rel in rel_links:
         target = (ROADMAP_PATH.parent / rel).resolve()
         if not target.exists():
@@ -81,26 +145,14 @@ def validate_roadmap_alignment_block(
     unreleased: str,
     errors: list[str],
 ) -> None:
-    block_match = re.search(
-        r"^### Roadmap Alignment\n(?P<body>.*?)(?=^### |\Z)",
-        unreleased,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+    block_match = ROADMAP_ALIGNMENT_RE.search(unreleased)
     if not block_match:
         errors.append("CHANGELOG [Unreleased] is missing '### Roadmap Alignment' block")
         return
 
     block = block_match.group("body")
-    phase_match = re.search(
-        r"^- Current roadmap phase:\s*(.+)$",
-        block,
-        flags=re.MULTILINE,
-    )
-    updated_match = re.search(
-        r"^- Roadmap last updated:\s*(\d{4}-\d{2}-\d{2})$",
-        block,
-        flags=re.MULTILINE,
-    )
+    phase_match = ALIGNMENT_PHASE_RE.search(block)
+    updated_match = ALIGNMENT_UPDATED_RE.search(block)
 
     if not phase_match:
         errors.append("Roadmap Alignment block missing '- Current roadmap phase:'")
@@ -121,16 +173,15 @@ def validate_roadmap_alignment_block(
 
 def parse_table_rows(markdown: str) -> list[list[str]]:
     rows: list[list[str]] = []
-    for line in markdown.splitlines():
-        line = line.strip()
-        if not line.startswith("|"):
-            continue
-        cells = [cell.strip() for cell in line.strip("|").split("|")]
+    for match in TABLE_LINE_RE.finditer(markdown):
+        # Only the first four cells are used, so never split further than that.
+        cells = match.group(1).strip().strip("|").split("|", 4)
         if len(cells) < 4:
             continue
+        cells = [cell.strip() for cell in cells[:4]]
         if cells[0] == "Plan" or set(cells[0]) == {"-"}:
             continue
-        rows.append(cells[:4])
+        rows.append(cells)
     return rows
 
 
@@ -153,6 +204,7 @@ def validate_plan_lifecycle(errors: list[str]) -> None:
         errors.append("PLAN_LIFECYCLE.md must define at least one lifecycle row")
         return
 
+    plan_files = list_plan_files()
     superseded_count = 0
 
     for plan_cell, status, superseded_by_cell, _notes in rows:
@@ -167,14 +219,13 @@ def validate_plan_lifecycle(errors: list[str]) -> None:
                 f"(allowed: {', '.join(sorted(LIFECYCLE_STATUSES))})"
             )
 
-        plan_path = ROOT / "docs/plans" / plan_rel
-        if not plan_path.exists():
+        if not plan_exists(plan_rel, plan_files):
             errors.append(
                 f"Lifecycle entry references missing file: docs/plans/{plan_rel}"
             )
             continue
 
-        plan_text = plan_path.read_text(encoding="utf-8")
+        plan_text = read_plan(PLANS_DIR / plan_rel)
 
         if status == "Superseded":
             superseded_count += 1
@@ -190,8 +241,7 @@ def validate_plan_lifecycle(errors: list[str]) -> None:
                 )
                 continue
 
-            superseded_path = ROOT / "docs/plans" / superseded_rel
-            if not superseded_path.exists():
+            if not plan_exists(superseded_rel, plan_files):
                 errors.append(
                     f"Superseded target does not exist: docs/plans/{superseded_rel}"
                 )
@@ -215,8 +265,9 @@ def validate_release_template(errors: list[str]) -> None:
     template = read_text(RELEASE_TEMPLATE_PATH, errors)
     if not template:
         return
+    found = {match.group(0) for match in TEMPLATE_HEADINGS_RE.finditer(template)}
     for heading in REQUIRED_TEMPLATE_HEADINGS:
-        if heading not in template:
+        if heading not in found:
             errors.append(
                 f"Release notes template missing required heading '{heading}'"
             )
@@ -224,7 +275,7 @@ def validate_release_template(errors: list[str]) -> None:
 
 def check_observability_plan_linkage(errors: list[str]) -> None:
     """Verify observability plan linkage: plan file, ops docs, and roadmap reference."""
-    plan_path = ROOT / "docs/plans/2026-02-27-phase-7-observability-telemetry-task-plan.md"
+    plan_path = PLANS_DIR / "2026-02-27-phase-7-observability-telemetry-task-plan.md"
     contract_path = ROOT / "docs/ops/observability-contract.md"
     runbook_path = ROOT / "docs/ops/observability-runbook.md"
 
@@ -234,7 +285,7 @@ def check_observability_plan_linkage(errors: list[str]) -> None:
             "docs/plans/2026-02-27-phase-7-observability-telemetry-task-plan.md"
         )
     else:
-        plan_text = plan_path.read_text(encoding="utf-8")
+        plan_text = read_plan(plan_path)
         if "**Status:**" not in plan_text:
             errors.append(
                 "Observability plan missing lifecycle metadata '**Status:**': "
@@ -258,21 +309,23 @@ def check_observability_plan_linkage(errors: list[str]) -> None:
 def main() -> int:
     errors: list[str] = []
 
-    roadmap = read_text(ROADMAP_PATH, errors)
-    changelog = read_text(CHANGELOG_PATH, errors)
-
-    if roadmap:
-        validate_roadmap_links(roadmap, errors)
-    if roadmap and changelog:
-        roadmap_phase, roadmap_last_updated = parse_roadmap_metadata(roadmap, errors)
-        unreleased = extract_unreleased(changelog, errors)
-        if roadmap_phase and roadmap_last_updated and unreleased:
-            validate_roadmap_alignment_block(
-                roadmap_phase,
-                roadmap_last_updated,
-                unreleased,
-                errors,
+    with map_file(ROADMAP_PATH, errors) as roadmap, map_file(
+        CHANGELOG_PATH, errors
+    ) as changelog:
+        if roadmap:
+            validate_roadmap_links(roadmap, errors)
+        if roadmap and changelog:
+            roadmap_phase, roadmap_last_updated = parse_roadmap_metadata(
+                roadmap, errors
             )
+            unreleased = extract_unreleased(changelog, errors)
+            if roadmap_phase and roadmap_last_updated and unreleased:
+                validate_roadmap_alignment_block(
+                    roadmap_phase,
+                    roadmap_last_updated,
+                    unreleased,
+                    errors,
+                )
 
     validate_plan_lifecycle(errors)
     validate_release_template(errors)
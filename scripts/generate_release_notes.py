@@ -11,6 +11,18 @@ from pathlib import Path
 
 SECTIONS = ("Added", "Changed", "Deprecated", "Removed", "Fixed", "Security")
 
+UNRELEASED_RE = re.compile(
+    r"^## \[Unreleased\]\n(?P<body>.*?)(?=^## \[|\Z)", re.MULTILINE | re.DOTALL
+)
+PHASE_RE = re.compile(r"^\*\*Current Phase:\*\*\s*(.+)$", re.MULTILINE)
+DATE_RE = re.compile(r"^\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})$", re.MULTILINE)
+# One pass over the Unreleased body: each match is either a `### Section`
+# heading or a `- bullet` line. Whitespace is limited to [ \t] so that no
+# match can run across a line break.
+SECTION_TOKEN_RE = re.compile(
+    r"^(?:###[ \t]+(?P<heading>.*\S)|(?P<bullet>[ \t]*-[ \t]+\S.*))", re.MULTILINE
+)
+
 
 def read_text(path: Path) -> str:
     if not path.exists():
@@ -19,25 +31,15 @@ def read_text(path: Path) -> str:
 
 
 def extract_unreleased(changelog: str) -> str:
-    match = re.search(
-        r"^## \[Unreleased\]\n(?P<body>.*?)(?=^## \[|\Z)",
-        changelog,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+    match = UNRELEASED_RE.search(changelog)
     if not match:
         raise ValueError("CHANGELOG.md is missing a [Unreleased] section")
     return match.group("body")
 
 
 def parse_roadmap_metadata(roadmap: str) -> tuple[str, str]:
-    phase_match = re.search(
-        r"^\*\*Current Phase:\*\*\s*(.+)$", roadmap, flags=re.MULTILINE
-    )
-    date_match = re.search(
-        r"^\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})$",
-        roadmap,
-        flags=re.MULTILINE,
-    )
+    phase_match = PHASE_RE.search(roadmap)
+    date_match = DATE_RE.search(roadmap)
     if not phase_match or not date_match:
         raise ValueError(
             "Roadmap metadata is incomplete (Current Phase / Last Updated)"
@@ -49,16 +51,15 @@ def collect_section_items(unreleased: str) -> dict[str, list[str]]:
     items = {section: [] for section in SECTIONS}
     current_section: str | None = None
 
-    for raw_line in unreleased.splitlines():
-        line = raw_line.rstrip()
-        heading_match = re.match(r"^###\s+(.+)$", line)
-        if heading_match:
-            heading = heading_match.group(1).strip()
+    for match in SECTION_TOKEN_RE.finditer(unreleased):
+        heading = match.group("heading")
+        if heading is not None:
+            heading = heading.strip()
             current_section = heading if heading in items else None
             continue
 
-        if current_section and re.match(r"^\s*-\s+", line):
-            items[current_section].append(line)
+        if current_section:
+            items[current_section].append(match.group("bullet").rstrip())
 
     return items
 
@@ -123,7 +124,7 @@ def main() -> int:
             section_items,
         )
         output_path = Path(args.output)
-        output_path.write_text(output, encoding="utf-8")
+        output_path.write_bytes(output.encode("utf-8"))
         print(f"Generated release notes at {output_path}")
         return 0
     except (FileNotFoundError, ValueError) as err:
@@ -1,79 +1,104 @@
-
+import asyncio
 import os
 import sys
-import requests
+import aiofiles
+import aiohttp
 import json
 import mimetypes
 
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
 # Configuration
 API_URL = "http://localhost:3000"
 USERNAME = "admin"
 PASSWORD = "password" # Assumes default admin seeded or user created
+MAX_CONCURRENT_UPLOADS = 8 # Keep directory uploads from flooding the server
+UPLOAD_CHUNK_SIZE = 64 * 1024
+EMOJI_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+def guess_mime_type(file_path):
+    ext = os.path.splitext(file_path)[1].lower()
+    mime_type = EMOJI_MIME_TYPES.get(ext)
+    if mime_type is None:
+        mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+    return mime_type
 
-def get_token():
+async def read_chunks(file_path):
+    # Stream the file into the request body instead of buffering it whole.
+    async with aiofiles.open(file_path, 'rb') as f:
+        while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+async def read_json(res):
+    if not res.ok:
+        raise RuntimeError(f"{res.status} {res.reason}: {await res.text()}")
+    return loads(await res.read())
+
+async def get_token(session):
     print(f"Logging in as {USERNAME}...")
     try:
-        res = requests.post(f"{API_URL}/auth/login", json={
+        async with session.post(f"{API_URL}/auth/login", json={
             "username": USERNAME,
             "password": PASSWORD
-        })
-        res.raise_for_status()
-        data = res.json()
+        }) as res:
+            data = await read_json(res)
         print("Login successful.")
         return data["access_token"]
     except Exception as e:
         print(f"Login failed: {e}")
-        if hasattr(e, 'response') and e.response:
-             print(e.response.text)
         sys.exit(1)
 
-def create_guild(token, name="Emoji Test Guild"):
+async def create_guild(session, token, name="Emoji Test Guild"):
     print(f"Creating test guild '{name}'...")
     try:
-        res = requests.post(
-            f"{API_URL}/api/guilds", 
+        async with session.post(
+            f"{API_URL}/api/guilds",
             json={"name": name, "description": "Guild for testing emojis"},
             headers={"Authorization": f"Bearer {token}"}
-        )
-        res.raise_for_status()
-        guild = res.json()
+        ) as res:
+            guild = await read_json(res)
         print(f"Guild created: {guild['id']}")
         return guild['id']
     except Exception as e:
         print(f"Failed to create guild: {e}")
-        if hasattr(e, 'response') and e.response:
-             print(e.response.text)
         sys.exit(1)
 
-def upload_emoji(token, guild_id, name, file_path):
-    print(f"Uploading emoji '{name}' from {file_path}...")
-    mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
-    
-    try:
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': (os.path.basename(file_path), f, mime_type)
-            }
-            data = {
-                'name': name
-            }
-            res = requests.post(
+async def upload_emoji(session, sem, token, guild_id, name, file_path):
+    async with sem:
+        print(f"Uploading emoji '{name}' from {file_path}...")
+        mime_type = guess_mime_type(file_path)
+
+        try:
+            form = aiohttp.FormData()
+            form.add_field('name', name)
+            form.add_field(
+                'file', read_chunks(file_path),
+                filename=os.path.basename(file_path),
+                content_type=mime_type
+            )
+            async with session.post(
                 f"{API_URL}/api/guilds/{guild_id}/emojis",
                 headers={"Authorization": f"Bearer {token}"},
-                files=files,
-                data=data
-            )
-            res.raise_for_status()
-            emoji = res.json()
+                data=form
+            ) as res:
+                emoji = await read_json(res)
             print(f"Uploaded emoji: {emoji['name']} ({emoji['id']})")
             return emoji
-    except Exception as e:
-        print(f"Failed to upload emoji: {e}")
-        if hasattr(e, 'response') and e.response:
-             print(e.response.text)
-        return None
+        except Exception as e:
+            print(f"Failed to upload emoji '{name}': {e}")
+            return None
 
-def main():
+async def main():
     if len(sys.argv) < 2:
         print("Usage: python3 upload_emojis.py <file_or_directory>")
         print("Example: python3 upload_emojis.py gfx/example/Floki-emojis.png")
@@ -84,21 +109,30 @@ def main():
         print(f"Path not found: {path}")
         sys.exit(1)
 
-    token = get_token()
-    guild_id = create_guild(token)
-    
-    if os.path.isfile(path):
-        name = os.path.splitext(os.path.basename(path))[0]
-        upload_emoji(token, guild_id, name, path)
-    elif os.path.isdir(path):
-        for filename in os.listdir(path):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                file_path = os.path.join(path, filename)
-                name = os.path.splitext(filename)[0]
-                upload_emoji(token, guild_id, name, file_path)
-    
+    # One session for every request so connections are kept alive
+    # across the login, guild creation and all emoji uploads.
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_UPLOADS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        token = await get_token(session)
+        guild_id = await create_guild(session, token)
+        sem = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+        if os.path.isfile(path):
+            name = os.path.splitext(os.path.basename(path))[0]
+            await upload_emoji(session, sem, token, guild_id, name, path)
+        elif os.path.isdir(path):
+            tasks = []
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    name, ext = os.path.splitext(entry.name)
+                    if ext.lower() in EMOJI_MIME_TYPES:
+                        tasks.append(upload_emoji(session, sem, token, guild_id, name, entry.path))
+            await asyncio.gather(*tasks)
+
     print("\nDone. You can list emojis with:")
     print(f"curl -H \"Authorization: Bearer {token}\" {API_URL}/api/guilds/{guild_id}/emojis")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())